@@ -29,17 +29,16 @@ Implementation Notes
 * Adafruit's Bus Device library:
   https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 
-* Adafruit's Register library:
-  https://github.com/adafruit/Adafruit_CircuitPython_Register
+* Adafruit's asyncio library, only for the ``async`` methods on CircuitPython:
+  https://github.com/adafruit/Adafruit_CircuitPython_asyncio
 
 """
 
 import time
-from collections import namedtuple
+import struct
+from array import array
 from micropython import const
 from adafruit_bus_device import i2c_device
-from adafruit_register.i2c_struct import UnaryStruct
-from adafruit_register.i2c_bits import RWBits
 
 try:
     from busio import I2C
@@ -85,7 +84,98 @@ COMP_ENABLED = const(0b1)
 comparator_mode_values = (COMP_DISABLED, COMP_ENABLED)
 comparator_mode_strings = ("COMP_DISABLED", "COMP_ENABLED")
 
-AlertStatus = namedtuple("AlertStatus", ["high_alert", "low_alert", "critical_alert"])
+# Accept either the value or its name, validating and converting in one lookup
+_OPERATION_MODE_LOOKUP = dict(
+    zip(operation_mode_values + operation_mode_strings, operation_mode_values * 2)
+)
+_RESOLUTION_MODE_LOOKUP = dict(
+    zip(resolution_mode_values + resolution_mode_strings, resolution_mode_values * 2)
+)
+_COMPARATOR_MODE_LOOKUP = dict(
+    zip(comparator_mode_values + comparator_mode_strings, comparator_mode_values * 2)
+)
+
+
+def _mode_value(lookup: dict, value: Union[int, str], setting: str) -> int:
+    """Return the register value for a mode given by value or by name."""
+    try:
+        return lookup[value]
+    except (KeyError, TypeError) as error:
+        raise ValueError("Value must be a valid {} setting".format(setting)) from error
+
+
+def _int_in_range(value: int, minimum: int, maximum: int, message: str) -> int:
+    """Return value as an int, raising ValueError with message unless it is a
+    whole number between minimum and maximum, inclusive."""
+    try:
+        # Range check first, int() cannot convert infinity or NaN
+        valid = minimum <= value <= maximum and value == int(value)
+    except (TypeError, ValueError):
+        valid = False
+    if not valid:
+        raise ValueError(message)
+    return int(value)
+
+
+# Address of the first register of the burst reads
+_TEMP_ADDRESS = b"\x00"
+# TEMP, STATUS, CONFIG, T_HIGH, T_LOW, T_CRIT and T_HYST read in one burst
+_REGISTERS = struct.Struct(">hBBhhhB")
+# Register address followed by T_HIGH, T_LOW and T_CRIT, written in one burst
+_LIMITS = struct.Struct(">Bhhh")
+
+
+class AlertStatus:
+    """Triggered status of the high, low and critical temperature alerts.
+
+    Like the named tuple it replaces, it can be unpacked, indexed and compared
+    with a ``(high_alert, low_alert, critical_alert)`` tuple.
+
+    :param int high_alert: Status of the high temperature alert
+    :param int low_alert: Status of the low temperature alert
+    :param int critical_alert: Status of the critical temperature alert
+    """
+
+    __slots__ = ("high_alert", "low_alert", "critical_alert")
+
+    def __init__(self, high_alert: int, low_alert: int, critical_alert: int) -> None:
+        self.high_alert = high_alert
+        self.low_alert = low_alert
+        self.critical_alert = critical_alert
+
+    def _as_tuple(self) -> tuple:
+        return (self.high_alert, self.low_alert, self.critical_alert)
+
+    def __iter__(self):
+        return iter(self._as_tuple())
+
+    def __len__(self) -> int:
+        return 3
+
+    def __getitem__(self, index: int) -> int:
+        return self._as_tuple()[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AlertStatus):
+            other = other._as_tuple()
+        return self._as_tuple() == other
+
+    def __hash__(self) -> int:
+        return hash(self._as_tuple())
+
+    def __repr__(self) -> str:
+        return "AlertStatus(high_alert={}, low_alert={}, critical_alert={})".format(
+            self.high_alert, self.low_alert, self.critical_alert
+        )
+
+
+def _alert_status(status: int) -> AlertStatus:
+    """Decode the alert flags from a status register value."""
+    return AlertStatus(
+        high_alert=(status >> 5) & 1,
+        low_alert=(status >> 4) & 1,
+        critical_alert=(status >> 6) & 1,
+    )
 
 
 class ADT7410:
@@ -93,6 +183,11 @@ class ADT7410:
 
     :param ~busio.I2C i2c_bus: The I2C bus the ADT7410 is connected to.
     :param int address: The I2C device address. Default is :const:`0x48`
+    :param int smooth_window: Number of readings in the moving median filter
+     applied by :meth:`sample`. Default is :const:`0`, no filtering
+    :param bool check_id: Verify the device ID on initialization. Set to `False`
+     to skip that I2C transaction when the bus topology is already known.
+     Default is `True`
 
     **Quickstart: Importing and using the ADT7410 temperature sensor**
 
@@ -119,30 +214,187 @@ class ADT7410:
 
     """
 
-    _device_id = UnaryStruct(_REG_WHOAMI, "B")
-    _temperature = UnaryStruct(_TEMP, ">h")
-    _temperature_high = UnaryStruct(_TEMP_HIGH, ">h")
-    _temperature_low = UnaryStruct(_TEMP_LOW, ">h")
-    _temperature_critical = UnaryStruct(_TEMP_CRITICAL, ">h")
-    _temperature_hysteresis = UnaryStruct(_TEMP_HYSTERESIS, "B")
-    _status = UnaryStruct(_STATUS, "B")
-
-    # Configuration register
-    _resolution_mode = RWBits(1, _CONFIGURATION, 7)
-    _operation_mode = RWBits(2, _CONFIGURATION, 5)
-    _comparator_mode = RWBits(1, _CONFIGURATION, 4)
-
-    # Status Register
-    _critical_alert = RWBits(1, _STATUS, 6)
-    _high_alert = RWBits(1, _STATUS, 5)
-    _low_alert = RWBits(1, _STATUS, 4)
-
-    def __init__(self, i2c_bus: I2C, address: int = 0x48) -> None:
+    def __init__(
+        self,
+        i2c_bus: I2C,
+        address: int = 0x48,
+        *,
+        smooth_window: int = 0,
+        check_id: bool = True,
+    ) -> None:
         self.i2c_device = i2c_device.I2CDevice(i2c_bus, address)
-
-        if self._device_id != 0xCB:
+        # Burst reads, sample() and the multi-byte writes share one buffer,
+        # single register reads and writes use the small ones
+        self._buffer = bytearray(_REGISTERS.size)
+        self._address_buffer = bytearray(1)
+        self._buffer2 = bytearray(2)
+        self._ring = array("h", [0] * smooth_window)
+        self._ring_index = 0
+        self._ring_count = 0
+
+        if check_id and self._read_u8(_REG_WHOAMI) != 0xCB:
             raise RuntimeError("Failed to find ADT7410")
 
+        # The configuration register is only changed by this driver, so keep
+        # a copy of it to set its fields without reading it back first
+        self._configuration = self._read_u8(_CONFIGURATION)
+
+    def _write_configuration(self, configuration: int) -> None:
+        """Write the configuration register and update its shadow copy."""
+        self._configuration = configuration
+        self._write_u8(_CONFIGURATION, configuration)
+
+    def _read_u8(self, register: int) -> int:
+        """Read an unsigned byte register with a single write_then_readinto."""
+        self._address_buffer[0] = register
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._address_buffer, self._buffer2, in_end=1)
+        return self._buffer2[0]
+
+    def _read_s16(self, register: int) -> int:
+        """Read a big-endian signed 16 bit register with a single
+        write_then_readinto."""
+        self._address_buffer[0] = register
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._address_buffer, self._buffer2)
+        raw = (self._buffer2[0] << 8) | self._buffer2[1]
+        # Sign extend the two's complement value without branching
+        return raw - ((raw & 0x8000) << 1)
+
+    def _write_u8(self, register: int, value: int) -> None:
+        """Write an unsigned byte register."""
+        self._buffer2[0] = register
+        self._buffer2[1] = value
+        with self.i2c_device as i2c:
+            i2c.write(self._buffer2)
+
+    def _write_s16(self, register: int, value: int) -> None:
+        """Write a big-endian signed 16 bit register."""
+        self._buffer[0] = register
+        self._buffer[1] = (value >> 8) & 0xFF
+        self._buffer[2] = value & 0xFF
+        with self.i2c_device as i2c:
+            i2c.write(self._buffer, end=3)
+
+    def _read_all(self) -> None:
+        """Read registers 0x00 to 0x0A into the buffer in a single transaction,
+        relying on the register address pointer auto-increment."""
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(_TEMP_ADDRESS, self._buffer)
+
+    def sample(self) -> tuple:
+        """
+        Read the :attr:`temperature` and the :attr:`alert_status` in a single
+        3 byte I2C transaction, returned as a ``(temperature, alert_status)``
+        tuple.
+
+        Reading the status register clears the alert flags, in the same
+        way as :attr:`alert_status`.
+
+        When the sensor was created with a ``smooth_window``, the temperature
+        returned is the median of the last ``smooth_window`` readings.
+
+        .. code-block:: python
+
+            adt = adafruit_adt7410.ADT7410(i2c, smooth_window=5)
+            temperature, alert_status = adt.sample()
+        """
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(_TEMP_ADDRESS, self._buffer, in_end=3)
+        raw = (self._buffer[0] << 8) | self._buffer[1]
+        raw -= (raw & 0x8000) << 1
+        if self._ring:
+            raw = self._smooth(raw)
+        return raw * 0.0078125, _alert_status(self._buffer[2])
+
+    def _smooth(self, raw: int) -> int:
+        """Add a raw reading to the ring buffer and return the median of the
+        readings stored so far."""
+        size = len(self._ring)
+        self._ring[self._ring_index] = raw
+        self._ring_index = (self._ring_index + 1) % size
+        if self._ring_count < size:
+            self._ring_count += 1
+            return sorted(self._ring[: self._ring_count])[self._ring_count // 2]
+        return sorted(self._ring)[size // 2]
+
+    async def sample_async(self) -> tuple:
+        """
+        Coroutine version of :meth:`sample`, yielding to the event loop once
+        before reading so other tasks get to run. The read itself runs on the
+        event loop, so it never races other calls on the same sensor.
+
+        To use a native asynchronous I2C backend instead, such as
+        ``smbus2_asyncio`` on Linux, await its read of 3 bytes from register
+        ``0x00`` and decode them the same way as :meth:`sample`.
+
+        .. code-block:: python
+
+            async def read_temperature(adt):
+                while True:
+                    temperature, alert_status = await adt.sample_async()
+                    print("Temperature: {:.2f}C".format(temperature))
+                    await asyncio.sleep(1)
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        await asyncio.sleep(0)
+        return self.sample()
+
+    def start_oneshot(self) -> None:
+        """Start a single conversion in :const:`ONE_SHOT` mode without waiting
+        for it. Read the result with :meth:`read_oneshot` once it is ready,
+        240 ms later or when :meth:`operation_mode_ready` returns `True`."""
+        self.set_operation_mode(ONE_SHOT, wait=False)
+
+    def read_oneshot(self) -> tuple:
+        """Read the result of a conversion started with :meth:`start_oneshot`,
+        as the ``(temperature, alert_status)`` tuple returned by :meth:`sample`."""
+        return self.sample()
+
+    async def sample_oneshot_async(self) -> tuple:
+        """
+        Run a :const:`ONE_SHOT` conversion, awaiting the 240 ms conversion time
+        instead of blocking, and return the ``(temperature, alert_status)``
+        tuple returned by :meth:`sample`.
+
+        .. code-block:: python
+
+            temperature, alert_status = await adt.sample_oneshot_async()
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        self.start_oneshot()
+        await asyncio.sleep(0.24)
+        return self.read_oneshot()
+
+    def read_registers(self) -> tuple:
+        """
+        Read the temperature, the alert status and the temperature limits in
+        a single I2C transaction, returned as a tuple of
+        ``(temperature, alert_status, high_temperature, low_temperature,
+        critical_temperature, hysteresis_temperature)``.
+
+        Reading the status register clears the alert flags, in the same
+        way as :attr:`alert_status`.
+
+        .. code-block:: python
+
+            temperature, alert_status, high, low, critical, hysteresis = adt.read_registers()
+        """
+        self._read_all()
+        temp, status, _, high, low, critical, hysteresis = _REGISTERS.unpack_from(
+            self._buffer
+        )
+        return (
+            temp * 0.0078125,
+            _alert_status(status),
+            high >> 7,
+            low >> 7,
+            critical >> 7,
+            hysteresis,
+        )
+
     @property
     def operation_mode(self) -> str:
         """
@@ -190,18 +442,72 @@ class ADT7410:
         +--------------------------------+------------------+
         | :py:const:`adt7410.SHUTDOWN`   | :py:const:`0b11` |
         +--------------------------------+------------------+
+
+        Setting this waits for the first conversion in the new mode, like
+        :meth:`set_operation_mode` with ``wait`` set. That polls the status
+        register, which clears any latched high, low and critical alert flags,
+        so read :attr:`alert_status` first if pending alerts matter.
         """
-        return operation_mode_strings[self._operation_mode]
+        return operation_mode_strings[(self._configuration >> 5) & 0b11]
 
     @operation_mode.setter
     def operation_mode(self, value: Union[int, str]) -> None:
-        if value not in operation_mode_values:
-            if value not in operation_mode_strings:
-                raise ValueError("Value must be a valid operation_mode setting")
+        self.set_operation_mode(value)
+
+    def set_operation_mode(self, value: Union[int, str], *, wait: bool = True) -> bool:
+        """
+        Set the sensor :attr:`operation_mode`.
+
+        With ``wait`` set, return as soon as the status register reports the
+        first conversion in the new mode as ready, or after 250 ms at most.
+        :const:`SHUTDOWN` never waits, as no conversion is started.
+        Setting ``wait`` to `False` returns right after the write, so the
+        conversion can be overlapped with other work and checked later with
+        :meth:`operation_mode_ready`
 
-            value = operation_mode_strings.index(value)
-        self._operation_mode = value
-        time.sleep(0.24)
+        Waiting polls the status register, which clears any latched high, low
+        and critical alert flags, in the same way as :attr:`alert_status`.
+        Read :attr:`alert_status` before changing the mode if pending alerts
+        matter.
+
+        .. code-block:: python
+
+            adt.set_operation_mode(adt7410.ONE_SHOT, wait=False)
+            # do something else
+            while not adt.operation_mode_ready():
+                pass
+            print(adt.temperature)
+
+        :param int|str value: The operation mode value or name
+        :param bool wait: Wait for the first conversion. Defaults to `True`
+        :return: `True` if the conversion was reported ready, or none was
+         started for :const:`SHUTDOWN`. `False` if it was not waited for, or
+         was still not ready after 250 ms
+        """
+        value = _mode_value(_OPERATION_MODE_LOOKUP, value, "operation_mode")
+        self._write_configuration((self._configuration & ~0x60) | (value << 5))
+        if value == SHUTDOWN:
+            return True
+        # Reading the temperature resets RDY, so a result pending from before
+        # the mode change is not mistaken for the new conversion
+        self._read_s16(_TEMP)
+        if not wait:
+            return False
+        for _ in range(50):
+            if self.operation_mode_ready():
+                return True
+            time.sleep(0.005)
+        return False
+
+    def operation_mode_ready(self) -> bool:
+        """Whether a new conversion result is ready to be read, from the
+        status register RDY bit. Reading the temperature clears it again.
+
+        Reading the status register also clears the alert flags, in the same
+        way as :attr:`alert_status`.
+        """
+        # Bit 7 of the status register is active low
+        return not self._read_u8(_STATUS) & 0x80
 
     @property
     def temperature(self) -> float:
@@ -221,7 +527,7 @@ class ADT7410:
         exceeds these limits, the INT pin is activated; and if it exceeds the
         :attr:`critical_temp` limit, the CT pin is activated.
         """
-        return self._temperature / 128
+        return self._read_s16(_TEMP) * 0.0078125
 
     @property
     def resolution_mode(self) -> str:
@@ -237,21 +543,25 @@ class ADT7410:
         +-------------------------------------+-----------------+
         """
 
-        return resolution_mode_strings[self._resolution_mode]
+        return resolution_mode_strings[self._configuration >> 7]
 
     @resolution_mode.setter
     def resolution_mode(self, value: Union[int, str]) -> None:
-        if value not in resolution_mode_values:
-            if value not in resolution_mode_strings:
-                raise ValueError("Value must be a valid resolution_mode setting")
-
-            value = resolution_mode_strings.index(value)
-        self._resolution_mode = value
+        value = _mode_value(_RESOLUTION_MODE_LOOKUP, value, "resolution_mode")
+        self._write_configuration((self._configuration & ~0x80) | (value << 7))
 
     @property
     def high_resolution(self) -> bool:
-        """Whether the device is currently configured for high resolution mode."""
-        return self.resolution_mode == HIGH_RESOLUTION
+        """Whether the device is currently configured for high resolution mode.
+
+        .. code-block:: python
+
+            adt.resolution_mode = adafruit_adt7410.HIGH_RESOLUTION
+            print(adt.high_resolution)  # True
+            adt.resolution_mode = adafruit_adt7410.LOW_RESOLUTION
+            print(adt.high_resolution)  # False
+        """
+        return bool(self._configuration & 0x80)
 
     @high_resolution.setter
     def high_resolution(self, value: bool) -> None:
@@ -259,8 +569,8 @@ class ADT7410:
 
     @property
     def alert_status(self):
-        """The current triggered status of the high and low temperature alerts as a AlertStatus
-        named tuple with attributes for the triggered status of each alert.
+        """The current triggered status of the high and low temperature alerts as an
+        :class:`AlertStatus` with attributes for the triggered status of each alert.
 
         .. code-block :: python
 
@@ -271,19 +581,17 @@ class ADT7410:
             i2c = board.I2C()  # uses board.SCL and board.SDA
             adt = adt7410.ADT7410(i2c)
 
-            tmp.low_temperature = 20
-            tmp.high_temperature = 23
-            tmp.critical_temperature = 30
+            adt.set_limits(low=20, high=23, critical=30)
 
-            print("High limit: {}".format(tmp.high_temperature))
-            print("Low limit: {}".format(tmp.low_temperature))
-            print("Critical limit: {}".format(tmp.critical_temperature))
+            print("High limit: {}".format(adt.high_temperature))
+            print("Low limit: {}".format(adt.low_temperature))
+            print("Critical limit: {}".format(adt.critical_temperature))
 
             adt.comparator_mode = adt7410.COMP_ENABLED
 
             while True:
                 print("Temperature: {:.2f}C".format(adt.temperature))
-                alert_status = tmp.alert_status
+                alert_status = adt.alert_status
                 if alert_status.high_alert:
                     print("Temperature above high set limit!")
                 if alert_status.low_alert:
@@ -294,11 +602,7 @@ class ADT7410:
 
         """
 
-        return AlertStatus(
-            high_alert=self._high_alert,
-            low_alert=self._low_alert,
-            critical_alert=self._critical_alert,
-        )
+        return _alert_status(self._read_u8(_STATUS))
 
     @property
     def comparator_mode(self) -> str:
@@ -313,16 +617,67 @@ class ADT7410:
         | :py:const:`adt7410.COMP_ENABLED`  | :py:const:`0b1` |
         +-----------------------------------+-----------------+
         """
-        return comparator_mode_strings[self._comparator_mode]
+        return comparator_mode_strings[(self._configuration >> 4) & 1]
 
     @comparator_mode.setter
     def comparator_mode(self, value: Union[int, str]) -> None:
-        if value not in comparator_mode_values:
-            if value not in comparator_mode_strings:
-                raise ValueError("Value must be a valid comparator_mode setting")
+        value = _mode_value(_COMPARATOR_MODE_LOOKUP, value, "comparator_mode")
+        self._write_configuration((self._configuration & ~0x10) | (value << 4))
+
+    def configure(
+        self,
+        *,
+        operation_mode: Union[int, str, None] = None,
+        resolution_mode: Union[int, str, None] = None,
+        comparator_mode: Union[int, str, None] = None,
+        fault_queue: Union[int, None] = None,
+    ) -> None:
+        """
+        Set several configuration register fields with a single write,
+        instead of one write per field. Fields left as `None` keep their
+        current setting.
+
+        Unlike :attr:`operation_mode`, this does not wait for the first
+        conversion in a new operation mode, use :meth:`operation_mode_ready`
+        to check for it.
 
-            value = comparator_mode_strings.index(value)
-        self._comparator_mode = value
+        .. code-block:: python
+
+            adt.configure(
+                operation_mode=adafruit_adt7410.SPS,
+                resolution_mode=adafruit_adt7410.HIGH_RESOLUTION,
+                comparator_mode=adafruit_adt7410.COMP_ENABLED,
+                fault_queue=2,
+            )
+
+        :param int|str operation_mode: The :attr:`operation_mode` value or name
+        :param int|str resolution_mode: The :attr:`resolution_mode` value or name
+        :param int|str comparator_mode: The :attr:`comparator_mode` value or name
+        :param int fault_queue: Number of consecutive faults, 1 to 4, needed
+         to trigger the INT and CT pins
+        """
+        config = self._configuration
+        if operation_mode is not None:
+            value = _mode_value(
+                _OPERATION_MODE_LOOKUP, operation_mode, "operation_mode"
+            )
+            config = (config & ~0x60) | (value << 5)
+        if resolution_mode is not None:
+            value = _mode_value(
+                _RESOLUTION_MODE_LOOKUP, resolution_mode, "resolution_mode"
+            )
+            config = (config & ~0x80) | (value << 7)
+        if comparator_mode is not None:
+            value = _mode_value(
+                _COMPARATOR_MODE_LOOKUP, comparator_mode, "comparator_mode"
+            )
+            config = (config & ~0x10) | (value << 4)
+        if fault_queue is not None:
+            fault_queue = _int_in_range(
+                fault_queue, 1, 4, "Fault queue should be between 1 and 4"
+            )
+            config = (config & ~0x03) | (fault_queue - 1)
+        self._write_configuration(config)
 
     @property
     def high_temperature(self) -> float:
@@ -338,13 +693,14 @@ class ADT7410:
         The default setting is 64°C
 
         """
-        return self._temperature_high // 128
+        return self._read_s16(_TEMP_HIGH) >> 7
 
     @high_temperature.setter
     def high_temperature(self, value: int) -> None:
-        if value not in range(-55, 151, 1):
-            raise ValueError("Temperature should be between -55C and 150C")
-        self._temperature_high = value * 128
+        value = _int_in_range(
+            value, -55, 150, "Temperature should be between -55C and 150C"
+        )
+        self._write_s16(_TEMP_HIGH, value << 7)
 
     @property
     def low_temperature(self) -> float:
@@ -359,13 +715,14 @@ class ADT7410:
         The INT pin is activated if an under temperature event occur
         The default setting is 10°C
         """
-        return self._temperature_low // 128
+        return self._read_s16(_TEMP_LOW) >> 7
 
     @low_temperature.setter
     def low_temperature(self, value: int) -> None:
-        if value not in range(-55, 151, 1):
-            raise ValueError("Temperature should be between -55C and 150C")
-        self._temperature_low = value * 128
+        value = _int_in_range(
+            value, -55, 150, "Temperature should be between -55C and 150C"
+        )
+        self._write_s16(_TEMP_LOW, value << 7)
 
     @property
     def critical_temperature(self) -> float:
@@ -380,13 +737,14 @@ class ADT7410:
         The INT pin is activated if a critical over temperature event occur
         The default setting is 147°C
         """
-        return self._temperature_critical // 128
+        return self._read_s16(_TEMP_CRITICAL) >> 7
 
     @critical_temperature.setter
     def critical_temperature(self, value: int) -> None:
-        if value not in range(-55, 151, 1):
-            raise ValueError("Temperature should be between -55C and 15C")
-        self._temperature_critical = value * 128
+        value = _int_in_range(
+            value, -55, 150, "Temperature should be between -55C and 150C"
+        )
+        self._write_s16(_TEMP_CRITICAL, value << 7)
 
     @property
     def hysteresis_temperature(self) -> float:
@@ -395,10 +753,33 @@ class ADT7410:
         :attr:`critical_temperature`, :attr:`high_temperature` and
         :attr:`low_temperature` limits
         """
-        return self._temperature_hysteresis
+        return self._read_u8(_TEMP_HYSTERESIS)
 
     @hysteresis_temperature.setter
     def hysteresis_temperature(self, value: int) -> None:
-        if value not in range(0, 16, 1):
-            raise ValueError("Temperature should be between 0C and 15C")
-        self._temperature_hysteresis = value
+        value = _int_in_range(value, 0, 15, "Temperature should be between 0C and 15C")
+        self._write_u8(_TEMP_HYSTERESIS, value)
+
+    def set_limits(self, *, high: int, low: int, critical: int) -> None:
+        """
+        Set the :attr:`high_temperature`, :attr:`low_temperature` and
+        :attr:`critical_temperature` limits in Celsius with a single burst
+        write to their contiguous registers, instead of one write per limit.
+
+        .. code-block:: python
+
+            adt.set_limits(low=20, high=23, critical=30)
+
+        :param int high: High temperature limit, between -55C and 150C
+        :param int low: Low temperature limit, between -55C and 150C
+        :param int critical: Critical temperature limit, between -55C and 150C
+        """
+        message = "Temperature should be between -55C and 150C"
+        high = _int_in_range(high, -55, 150, message)
+        low = _int_in_range(low, -55, 150, message)
+        critical = _int_in_range(critical, -55, 150, message)
+        _LIMITS.pack_into(
+            self._buffer, 0, _TEMP_HIGH, high << 7, low << 7, critical << 7
+        )
+        with self.i2c_device as i2c:
+            i2c.write(self._buffer, end=_LIMITS.size)
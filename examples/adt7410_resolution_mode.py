@@ -10,12 +10,15 @@ i2c = board.I2C()
 adt = adt7410.ADT7410(i2c)
 
 adt.resolution_mode = adt7410.HIGH_RESOLUTION
+# One conversion per second, idling in between, draws much less power than
+# converting continuously. The sensor converts in the background while we sleep
+adt.set_operation_mode(adt7410.SPS, wait=False)
 
 while True:
     for resolution_mode in adt7410.resolution_mode_values:
         print("Current Resolution mode setting: ", adt.resolution_mode)
         for _ in range(10):
-            temp = adt.temperature
+            temp = adt.sample()[0]
             print("Temperature :{:.2f}C".format(temp))
-            time.sleep(0.5)
+            time.sleep(1)
         adt.resolution_mode = resolution_mode
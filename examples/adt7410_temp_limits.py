@@ -8,9 +8,7 @@ import adt7410
 i2c = board.I2C()  # uses board.SCL and board.SDA
 adt = adt7410.ADT7410(i2c)
 
-adt.low_temperature = 18
-adt.high_temperature = 29
-adt.critical_temperature = 35
+adt.set_limits(low=18, high=29, critical=35)
 adt.hysteresis_temperature = 2
 
 print("High limit: {}C".format(adt.high_temperature))
@@ -20,8 +18,8 @@ print("Critical limit: {}C".format(adt.critical_temperature))
 adt.comparator_mode = adt7410.COMP_ENABLED
 
 while True:
-    print("Temperature: {:.2f}C".format(adt.temperature))
-    alert_status = adt.alert_status
+    temperature, alert_status = adt.sample()
+    print("Temperature: {:.2f}C".format(temperature))
     if alert_status.high_alert:
         print("Temperature above high set limit!")
     if alert_status.low_alert: